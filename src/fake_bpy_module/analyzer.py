@@ -1,7 +1,23 @@
-import xml.etree.ElementTree as et
+import os
 import re
 from typing import List
 import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    from lxml import etree as et
+    _LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as et
+    _LXML_AVAILABLE = False
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
 
 from .common import (
     IntermidiateDataType,
@@ -20,48 +36,101 @@ from .utils import (
     LOG_LEVEL_ERR
 )
 
+_WS_RE = re.compile(r"\s+")
+_PAREN_WS_RE = re.compile(r"\(\s+")
+_PARAM_FULL_RE = re.compile(r"([a-zA-Z0-9_]+) \((.+)\) – (.+)")
+_PARAM_NO_TYPE_RE = re.compile(r"([a-zA-Z0-9_]+) – (.+)")
+_PARAM_NO_DESC_RE = re.compile(r"([a-zA-Z0-9_]+) \((.+)\) – ")
+_PARAM_DELIMITER_RE = re.compile(r"[(),]")
+
+
+@lru_cache(maxsize=None)
+def _intermidiate_data_type(data_type: str) -> 'IntermidiateDataType':
+    # IntermidiateDataType is never modified after construction, so the same
+    # data type string can share one instance.
+    return IntermidiateDataType(data_type)
+
 
 def textify(elm) -> str:
-    s = []
-    if elm.text:
-        s.append(elm.text)
-    for child in elm.getchildren():
-        s.extend(textify(child))
+    if _LXML_AVAILABLE:
+        return et.tostring(elm, method="text", encoding="unicode",
+                           with_tail=True)
+
+    s = ''.join(elm.itertext())
     if elm.tail:
-        s.append(elm.tail)
+        s += elm.tail
+
+    return s
+
 
-    return ''.join(s)
+def iter_children(elm, *tags):
+    """Iterate over the direct children of elm whose tag is one of tags."""
+    if _LXML_AVAILABLE:
+        return elm.iterchildren(*tags)     # filtered in C layer
+    return (child for child in elm if child.tag in tags)
+
+
+class _DescContentResult:
+    """Data collected from <desc_content> by the analyzers below."""
+
+    __slots__ = (
+        "desc",
+        "data_dtype",
+        "return_dtype",
+        "return_desc",
+        "params_detail",
+        "method",
+        "attribute",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.desc: str = None
+        self.data_dtype: str = None
+        self.return_dtype: str = None
+        self.return_desc: str = None
+        self.params_detail: List['ParameterDetailInfo'] = None
+        self.method: List['FunctionInfo'] = None
+        self.attribute: List['VariableInfo'] = None
 
 
 class VariableAnalyzer:
     def __init__(self, filename: str, type_: str):
         self.filename: str = filename
         self.info: 'VariableInfo' = VariableInfo(type_)
+        self._result: '_DescContentResult' = _DescContentResult()
 
     def _parse_field(self, elm, result):
         field_type = ""
-        for child in list(elm):
+        for child in iter_children(elm, "field_name", "field_body"):
             if child.tag == "field_name":
                 field_type = child.text
             elif child.tag == "field_body":
                 if field_type == "Type":
-                    result["data_dtype"] = re.sub(r'\s+', ' ', textify(child))
+                    result.data_dtype = _WS_RE.sub(' ', textify(child))
 
     def _parse_field_list(self, elm, result):
-        for child in list(elm):
-            if child.tag == "field":
-                self._parse_field(child, result)
+        for child in iter_children(elm, "field"):
+            self._parse_field(child, result)
+
+    def _parse_desc_paragraph(self, elm, result):
+        result.desc = _WS_RE.sub(' ', textify(elm))
+
+    # <desc_content> child tag -> handler
+    _DESC_CONTENT_HANDLERS = {
+        "paragraph": _parse_desc_paragraph,
+        "field_list": _parse_field_list,
+    }
 
     def _parse_desc_content(self, elm, result):
-        for child in list(elm):
-            if child.tag == "paragraph":
-                result["desc"] = re.sub(r'\s+', ' ', textify(child))
-            elif child.tag == "field_list":
-                self._parse_field_list(child, result)
+        for child in iter_children(elm, *self._DESC_CONTENT_HANDLERS):
+            self._DESC_CONTENT_HANDLERS[child.tag](self, child, result)
 
     def analyze(self, elm) -> 'VariableInfo':
         signature_analyzed = False
-        for child in list(elm):
+        for child in iter_children(elm, "desc_signature", "desc_content"):
             if child.tag == "desc_signature":
                 if signature_analyzed:
                     msg = "desc_content must be parsed after parsing " \
@@ -93,14 +162,15 @@ class VariableAnalyzer:
                     output_log(LOG_LEVEL_ERR, msg)
                     raise RuntimeError(msg)
 
-                result = {}
+                result = self._result
+                result.reset()
                 self._parse_desc_content(child, result)
 
                 # get description/dtype data
-                if "desc" in result:
-                    self.info.set_description(result["desc"])
-                if "data_dtype" in result:
-                    self.info.set_data_type(IntermidiateDataType(result["data_dtype"]))
+                if result.desc is not None:
+                    self.info.set_description(result.desc)
+                if result.data_dtype is not None:
+                    self.info.set_data_type(_intermidiate_data_type(result.data_dtype))
 
         if not signature_analyzed:
             msg = "The data data is not parsed"
@@ -114,16 +184,16 @@ class FunctionAnalyzer:
     def __init__(self, filename, type_):
         self.filename: str = filename
         self.info: 'FunctionInfo' = FunctionInfo(type_)
+        self._result: '_DescContentResult' = _DescContentResult()
 
     def _get_return_type_paragraph(self, elm):
         all_str = textify(elm)
-        s = re.sub(r'\s+', ' ', all_str)
+        s = _WS_RE.sub(' ', all_str)
         return s
 
     def _get_return_type(self, elm):
-        for child in list(elm):
-            if child.tag == "paragraph":
-                return self._get_return_type_paragraph(child)
+        for child in iter_children(elm, "paragraph"):
+            return self._get_return_type_paragraph(child)
 
         output_log(
             LOG_LEVEL_WARN,
@@ -159,9 +229,8 @@ class FunctionAnalyzer:
         """
 
         name = None
-        for l in list(elm):
-            if (l.tag == "literal_strong") or (l.tag == "strong"):
-                name = l.text
+        for l in iter_children(elm, "literal_strong", "strong"):
+            name = l.text
         str_ = textify(elm)
         if name is None:
             output_log(
@@ -171,31 +240,28 @@ class FunctionAnalyzer:
             )
             return None
 
-        str_ = re.sub(r'\s+', ' ',  str_)
-        str_ = re.sub(r'\(\s+', '(', str_)
-        r = re.compile("([a-zA-Z0-9_]+) \((.+)\) – (.+)")
-        result = r.findall(str_)
-        if result:
+        str_ = _WS_RE.sub(' ', str_)
+        str_ = _PAREN_WS_RE.sub('(', str_)
+        m = _PARAM_FULL_RE.search(str_)
+        if m:
             info = ParameterDetailInfo()
-            info.set_name(result[0][0])
-            info.set_description(result[0][2])
-            info.set_data_type(IntermidiateDataType(result[0][1]))
+            info.set_name(m.group(1))
+            info.set_description(m.group(3))
+            info.set_data_type(_intermidiate_data_type(m.group(2)))
             return info
 
-        r = re.compile("([a-zA-Z0-9_]+) – (.+)")
-        result = r.findall(str_)
-        if result:
+        m = _PARAM_NO_TYPE_RE.search(str_)
+        if m:
             info = ParameterDetailInfo()
-            info.set_name(result[0][0])
-            info.set_description(result[0][1])
+            info.set_name(m.group(1))
+            info.set_description(m.group(2))
             return info
 
-        r = re.compile("([a-zA-Z0-9_]+) \((.+)\) – ")
-        result = r.findall(str_)
-        if result:
+        m = _PARAM_NO_DESC_RE.search(str_)
+        if m:
             info = ParameterDetailInfo()
-            info.set_name(result[0][0])
-            info.set_data_type(IntermidiateDataType(result[0][1]))
+            info.set_name(m.group(1))
+            info.set_data_type(_intermidiate_data_type(m.group(2)))
             return info
 
         output_log(
@@ -208,12 +274,11 @@ class FunctionAnalyzer:
 
     def _analyze_list_item(self, elm):
         paragraph = None
-        for child in list(elm):
-            if child.tag == "paragraph":
-                paragraph = child
-                break
+        for child in iter_children(elm, "paragraph"):
+            paragraph = child
+            break
 
-        if not paragraph:
+        if paragraph is None:
             output_log(
                 LOG_LEVEL_WARN,
                 "<paragraph> is not found (filename={0})".format(self.filename)
@@ -224,16 +289,15 @@ class FunctionAnalyzer:
 
     def _parse_bullet_list(self, elm):
         items = []
-        for child in list(elm):
-            if child.tag == "list_item":
-                item = self._analyze_list_item(child)
-                if item is not None:
-                    items.append(item)
+        for child in iter_children(elm, "list_item"):
+            item = self._analyze_list_item(child)
+            if item is not None:
+                items.append(item)
         return items
 
     def _analyze_param_list(self, elm, result):
         params = []
-        for child in list(elm):
+        for child in iter_children(elm, "bullet_list", "paragraph"):
             if child.tag == "bullet_list":
                 params = self._parse_bullet_list(child)
             elif child.tag == "paragraph":
@@ -241,74 +305,117 @@ class FunctionAnalyzer:
                 if p:
                     params = [p]
 
-        result["params_detail"] = params
+        result.params_detail = params
+
+    def _parse_return_type_field(self, elm, result):
+        result.return_dtype = self._get_return_type(elm)
+
+    def _parse_returns_field(self, elm, result):
+        result.return_desc = _WS_RE.sub(' ', textify(elm))
+
+    # <field_name> text -> handler for the following <field_body>
+    _FIELD_BODY_HANDLERS = {
+        "Parameters": _analyze_param_list,
+        "Return type": _parse_return_type_field,
+        "Returns": _parse_returns_field,
+    }
 
     def _parse_field(self, elm, result):
         field_type = ""
-        for child in list(elm):
+        for child in iter_children(elm, "field_name", "field_body"):
             if child.tag == "field_name":
                 field_type = child.text
             elif child.tag == "field_body":
-                if field_type == "Parameters":
-                    self._analyze_param_list(child, result)
-                elif field_type == "Return type":
-                    result["return_dtype"] = self._get_return_type(child)
-                elif field_type == "Returns":
-                    result["return_desc"] = re.sub(r'\s+', ' ', textify(child))
+                handler = self._FIELD_BODY_HANDLERS.get(field_type)
+                if handler is not None:
+                    handler(self, child, result)
 
     def _parse_field_list(self, elm, result):
-        for child in list(elm):
-            if child.tag == "field":
-                self._parse_field(child, result)
+        for child in iter_children(elm, "field"):
+            self._parse_field(child, result)
+
+    def _parse_desc_paragraph(self, elm, result):
+        result.desc = _WS_RE.sub(' ', textify(elm))
+
+    # <desc_content> child tag -> handler
+    _DESC_CONTENT_HANDLERS = {
+        "paragraph": _parse_desc_paragraph,
+        "field_list": _parse_field_list,
+    }
 
     def _parse_desc_content(self, elm, result):
-        for child in list(elm):
-            if child.tag == "paragraph":
-                result["desc"] = re.sub(r'\s+', ' ', textify(child))
-            elif child.tag == "field_list":
-                self._parse_field_list(child, result)
+        for child in iter_children(elm, *self._DESC_CONTENT_HANDLERS):
+            self._DESC_CONTENT_HANDLERS[child.tag](self, child, result)
 
     def _parse_parameter_body_text(self, text):
-        sp = [re.sub(" ", "", p) for p in text.split(",")]
+        # Every "," separates parameters if there is no parenthesis.
+        if ("(" not in text) and (")" not in text):
+            return [p.replace(" ", "") for p in text.split(",")]
 
         params = []
         parenthese_level = 0
-        next_param = ""
-        for p in sp:
-            parenthese_level += p.count("(") - p.count(")")
-            if parenthese_level < 0:
-                raise ValueError("Parenthese Level must be >= 0, but {}. (text: {}, filename: {})"
-                                 .format(parenthese_level, text, self.filename))
-
-            next_param += p + ","
-            if parenthese_level == 0:
-                params.append(next_param[:-1])  # strip last ","
-                next_param = ""
-        
+        start = 0
+        for m in _PARAM_DELIMITER_RE.finditer(text):
+            c = m.group()
+            if c == "(":
+                parenthese_level += 1
+            elif c == ")":
+                parenthese_level -= 1
+            else:
+                if parenthese_level < 0:
+                    break
+                if parenthese_level == 0:
+                    params.append(text[start:m.start()].replace(" ", ""))
+                    start = m.end()
+
+        if parenthese_level < 0:
+            raise ValueError("Parenthese Level must be >= 0, but {}. (text: {}, filename: {})"
+                             .format(parenthese_level, text, self.filename))
         if parenthese_level != 0:
             raise ValueError("Parenthese Level must be == 0, but {}. (text: {}, filename: {})"
                              .format(parenthese_level, text, self.filename))
+        params.append(text[start:].replace(" ", ""))
 
         return params
 
     def _get_parameters(self, elm):
-        result = []
-        param_bodies = []
-        for child in list(elm):
-            if child.tag == "desc_parameter":
-                param_bodies.append(child.text)
-        result.extend(self._parse_parameter_body_text(",".join(param_bodies)))
-        return result
+        param_bodies = [child.text for child in iter_children(elm, "desc_parameter")]
+
+        # A default value including "," may be split into several
+        # <desc_parameter>, so they must be joined and split again by taking
+        # care of parentheses.
+        if (not param_bodies) or \
+           any(("(" in p) or (")" in p) for p in param_bodies):
+            return self._parse_parameter_body_text(",".join(param_bodies))
+
+        params = []
+        for p in param_bodies:
+            if "," in p:
+                params.extend([sp.replace(" ", "") for sp in p.split(",")])
+            else:
+                params.append(p.replace(" ", ""))
+        return params
 
     def analyze(self, elm) -> 'FunctionInfo':
         signature_analyzed = False
-        for child in list(elm):
+        for child in iter_children(elm, "desc_signature", "desc_content"):
             if child.tag == "desc_signature":
                 if signature_analyzed:
                     continue
 
                 fullname = child.get("fullname")
-                text = child.find("desc_name").text
+
+                # find <desc_name> and <desc_parameterlist> in one pass
+                desc_name = None
+                desc_parameterlist = None
+                for c in iter_children(child, "desc_name", "desc_parameterlist"):
+                    if c.tag == "desc_name":
+                        if desc_name is None:
+                            desc_name = c
+                    elif desc_parameterlist is None:
+                        desc_parameterlist = c
+
+                text = desc_name.text
                 lp = text.find("(")
                 rp = text.rfind(")")
                 if (lp == -1) or (rp == -1):
@@ -332,9 +439,8 @@ class FunctionAnalyzer:
 
                     # get parameters
                     params = []
-                    c = child.find("desc_parameterlist")
-                    if c is not None:
-                        params = self._get_parameters(c)
+                    if desc_parameterlist is not None:
+                        params = self._get_parameters(desc_parameterlist)
                 else:
                     if lp == -1:
                         raise ValueError("( is not found. (text: {}, filename: {})"
@@ -375,24 +481,25 @@ class FunctionAnalyzer:
                     output_log(LOG_LEVEL_ERR, msg)
                     raise RuntimeError(msg)
 
-                result = {}
+                result = self._result
+                result.reset()
                 self._parse_desc_content(child, result)
 
                 # get description data
-                if "desc" in result.keys():
-                    self.info.set_description(result["desc"])
+                if result.desc is not None:
+                    self.info.set_description(result.desc)
 
                 # get return data
                 return_builder = ReturnInfo()
-                if "return_dtype" in result.keys():
-                    return_builder.set_data_type(IntermidiateDataType(result["return_dtype"]))
-                if "return_desc" in result.keys():
-                    return_builder.set_description(result["return_desc"])
+                if result.return_dtype is not None:
+                    return_builder.set_data_type(_intermidiate_data_type(result.return_dtype))
+                if result.return_desc is not None:
+                    return_builder.set_description(result.return_desc)
                 self.info.set_return(return_builder)
 
                 # get params_detail data
-                if "params_detail" in result.keys():
-                    self.info.add_parameter_details(result["params_detail"])
+                if result.params_detail is not None:
+                    self.info.add_parameter_details(result.params_detail)
                 break
 
         if not signature_analyzed:
@@ -407,32 +514,39 @@ class ClassAnalyzer:
     def __init__(self, filename):
         self.filename: str = filename
         self.info: 'ClassInfo' = ClassInfo()
+        self._result: '_DescContentResult' = _DescContentResult()
 
     def _parse_desc(self, desc, result):
         attr = desc.get("desctype")
-        if attr == "function" or attr == "method":
-            if "method" not in result:
-                result["method"] = []
+        if attr in ("function", "method"):
+            if result.method is None:
+                result.method = []
             analyzer = FunctionAnalyzer(self.filename, "method")
             m = analyzer.analyze(desc)
-            result["method"].append(m)
-        elif attr == "attribute" or attr == "data":
-            if "attribute" not in result:
-                result["attribute"] = []
+            result.method.append(m)
+        elif attr in ("attribute", "data"):
+            if result.attribute is None:
+                result.attribute = []
             analyzer = VariableAnalyzer(self.filename, "attribute")
             a = analyzer.analyze(desc)
-            result["attribute"].append(a)
+            result.attribute.append(a)
+
+    def _parse_desc_paragraph(self, elm, result):
+        result.desc = _WS_RE.sub(' ', textify(elm))
+
+    # <desc_content> child tag -> handler
+    _DESC_CONTENT_HANDLERS = {
+        "paragraph": _parse_desc_paragraph,
+        "desc": _parse_desc,
+    }
 
     def _parse_desc_content(self, elm, result):
-        for child in list(elm):
-            if child.tag == "paragraph":
-                result["desc"] = re.sub(r'\s+', ' ', textify(child))
-            elif child.tag == "desc":
-                self._parse_desc(child, result)
+        for child in iter_children(elm, *self._DESC_CONTENT_HANDLERS):
+            self._DESC_CONTENT_HANDLERS[child.tag](self, child, result)
 
     def analyze(self, elm) -> 'ClassInfo':
         signature_analyzed = False
-        for child in list(elm):
+        for child in iter_children(elm, "desc_signature", "desc_content"):
             if child.tag == "desc_signature":
                 if signature_analyzed:
                     continue        # ignore
@@ -453,14 +567,15 @@ class ClassAnalyzer:
                     raise RuntimeError(msg)
 
                 # get description data
-                result = {}
+                result = self._result
+                result.reset()
                 self._parse_desc_content(child, result)
-                if "desc" in result.keys():
-                    self.info.set_description(result["desc"])
-                if "method" in result.keys():
-                    self.info.add_methods(result["method"])
-                if "attribute" in result.keys():
-                    self.info.add_attributes(result["attribute"])
+                if result.desc is not None:
+                    self.info.set_description(result.desc)
+                if result.method is not None:
+                    self.info.add_methods(result.method)
+                if result.attribute is not None:
+                    self.info.add_attributes(result.attribute)
 
         if not signature_analyzed:
             msg = "The class data is not parsed"
@@ -482,7 +597,7 @@ class BaseAnalyzer:
     def _analyze_desc(self, filename: str, desc) -> 'Info':
         result = None
         attr = desc.get("desctype")
-        if attr == "function" or attr == "method":
+        if attr in ("function", "method"):
             analyzer = FunctionAnalyzer(filename, "function")
             result = analyzer.analyze(desc)
         elif attr == "data":
@@ -495,25 +610,49 @@ class BaseAnalyzer:
         return result
 
     def _analyze_section(self, filename: str, elm, result: 'SectionInfo'):
-        for child in list(elm):
-            if child.tag == "desc":     # <desc>
-                r = self._analyze_desc(filename, child)
+        # Walk nested <section> with a stack of child iterators instead of
+        # recursion. <desc> are still collected in document order.
+        stack = [iter_children(elm, "desc", "section")]
+        while stack:
+            for child in stack[-1]:
+                if child.tag == "section":      # <section>
+                    stack.append(iter_children(child, "desc", "section"))
+                    break
+                r = self._analyze_desc(filename, child)     # <desc>
                 if r:
                     result.info_list.append(r)
-            elif child.tag == "section":    # <section>
-                self._analyze_section(filename, child, result)
+            else:
+                stack.pop()
 
     def _modify(self, result: 'AnalysisResult'):
         pass
 
     def _analyze_by_file(self, filename: str) -> 'AnalysisResult':
-        self.filenames.append(filename)
-
-        tree = et.parse(filename)
-        root = tree.getroot()       # <document>
         result = AnalysisResult()
-        for child in list(root):
-            if child.tag == "section":    # <section>
+        if _LXML_AVAILABLE:
+            # Stream top-level sections and drop each one after analysis,
+            # so that only one section is kept in memory at a time.
+            # Comments and processing instructions are never used, so they
+            # are discarded by the parser like xml.etree.ElementTree does.
+            # Blank text must be kept since it separates inline elements.
+            context = et.iterparse(filename, events=("end",), tag="section",
+                                   huge_tree=True, remove_comments=True,
+                                   remove_pis=True)
+            for _, section_elm in context:
+                parent = section_elm.getparent()
+                if (parent is None) or (parent.tag != "document"):
+                    continue    # nested <section> is analyzed with its parent
+                r: 'SectionInfo' = SectionInfo()
+                self._analyze_section(filename, section_elm, r)
+                result.section_info.append(r)
+
+                section_elm.clear(keep_tail=False)
+                while section_elm.getprevious() is not None:
+                    del parent[0]
+        else:
+            tree = et.parse(filename)
+            root = tree.getroot()       # <document>
+            for child in iter_children(root, "section"):    # <section>
                 r: 'SectionInfo' = SectionInfo()
                 self._analyze_section(filename, child, r)
                 result.section_info.append(r)
@@ -521,9 +660,19 @@ class BaseAnalyzer:
         return result
 
     def analyze(self, filenames: List[str]) -> 'AnalysisResult':
+        self.filenames.extend(filenames)
+
+        # Files are analyzed independently, so spread them over processes.
+        if len(filenames) > 1:
+            chunksize = max(1, len(filenames) // (4 * (os.cpu_count() or 1)))
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(self._analyze_by_file, filenames,
+                                            chunksize=chunksize))
+        else:
+            results = [self._analyze_by_file(f) for f in filenames]
+
         result = AnalysisResult()
-        for f in filenames:
-            r = self._analyze_by_file(f)
+        for r in results:
             result.section_info.extend(r.section_info)
 
         self._modify(result)
@@ -540,103 +689,101 @@ class AnalyzerWithModFile(BaseAnalyzer):
         for mod_file in self._mod_files:
             self._modify_with_mod_file(mod_file, result)
 
+    def _build_info_index(self, result: 'AnalysisResult'):
+        # (type, name) -> [(section, info), ...]
+        index = defaultdict(list)
+        for section in result.section_info:
+            for info in section.info_list:
+                index[(info.type(), info.name())].append((section, info))
+        return index
+
+    def _find_registered_info(self, index, item: dict) -> List['Info']:
+        if ("type" not in item) or ("name" not in item) or \
+           ("module" not in item):
+            return []
+        return [info for _, info in index.get((item["type"], item["name"]), [])
+                if info.module() == item["module"]]
+
     def _modify_with_mod_file(self, mod_file: str, result: 'AnalysisResult'):
-        with open(mod_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-            # Process "remove" field
-            #   - Remove item if the same item exists in AnalysisResult.
-            if "remove" in data.keys():
-                for item in data["remove"]:
-                    for section in result.section_info:
-                        remove_list = []
-                        for info in section.info_list:
-                            if ("type" not in item) or (info.type() != item["type"]):
-                                continue
-                            if ("name" not in item) or (info.name() != item["name"]):
-                                continue
-                            if (("module" in item) and (info.module() != item["module"])) or\
-                               (("module" not in item) and (info.module() is None)):
-                                remove_list.append(info)
-                        for rm in remove_list:
-                            section.info_list.remove(rm)
-                            output_log(LOG_LEVEL_WARN,
-                                       "{} (type={}) is removed"
-                                       .format(rm.name(), rm.type()))
-
-            # Process "new" field
-            #   - Add item if the same item doesn't exist in AnalysisResult.
-            if "new" in data.keys():
-                new_section = SectionInfo()
-                for item in data["new"]:
-
-                    # check if entry is already registered
-                    has_entry = False
-                    for section in result.section_info:
-                        for info in section.info_list:
-                            if ("type" not in item) or (info.type() != item["type"]):
-                                continue
-                            if ("name" not in item) or (info.name() != item["name"]):
-                                continue
-                            if ("module" not in item) or (info.module() != item["module"]):
-                                continue
-                            has_entry = True
-                            break
-                        if has_entry:
-                            break
-
-                    if not has_entry:
-                        if item["type"] == "constant":
-                            new_v = VariableInfo("constant")
-                            new_v.from_dict(item, 'NEW')
-                            new_section.info_list.append(new_v)
-                        elif item["type"] == "function":
-                            new_f = FunctionInfo("function")
-                            new_f.from_dict(item, 'NEW')
-                            new_section.info_list.append(new_f)
-                        elif item["type"] == "class":
-                            new_c = ClassInfo()
-                            new_c.from_dict(item, 'NEW')
-                            new_section.info_list.append(new_c)
-                        else:
-                            raise RuntimeError("Unsupported Type: {}"
-                                               .format(item["type"]))
-                    else:
+        with open(mod_file, "rb") as f:
+            raw = f.read()
+        if _ORJSON_AVAILABLE:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw.decode("utf-8"))
+
+        # All fields share one index which is kept in sync with
+        # AnalysisResult while processing.
+        index = self._build_info_index(result)
+
+        # Process "remove" field
+        #   - Remove item if the same item exists in AnalysisResult.
+        if "remove" in data:
+            for item in data["remove"]:
+                if ("type" not in item) or ("name" not in item):
+                    continue
+                key = (item["type"], item["name"])
+                remaining = []
+                for section, info in index.get(key, []):
+                    if (("module" in item) and (info.module() != item["module"])) or\
+                       (("module" not in item) and (info.module() is None)):
+                        section.info_list.remove(info)
                         output_log(LOG_LEVEL_WARN,
-                                   "{} is already registered"
-                                   .format(item["name"]))
-
-                result.section_info.append(new_section)
-
-            # Process "append" field
-            #   - Add item's field if the same exists in AnalysisResult.
-            #   - Value of item's field must be None.
-            if "append" in data.keys():
-                for item in data["append"]:
-                    for section in result.section_info:
-                        for info in section.info_list:
-                            if ("type" not in item) or (info.type() != item["type"]):
-                                continue
-                            if ("name" not in item) or (info.name() != item["name"]):
-                                continue
-                            if ("module" not in item) or (info.module() != item["module"]):
-                                continue
-                            info.from_dict(item, 'APPEND')
-
-            # Process "update" field
-            #   - Update item's field if the same exists in AnalysisResult.
-            #   - Value of item's field can be None or some values.
-            if "update" in data.keys():
-                for item in data["update"]:
-                    for section in result.section_info:
-                        for info in section.info_list:
-                            if ("type" not in item) or (info.type() != item["type"]):
-                                continue
-                            if ("name" not in item) or (info.name() != item["name"]):
-                                continue
-                            if ("module" not in item) or (info.module() != item["module"]):
-                                continue
-                            info.from_dict(item, 'UPDATE')
+                                   "{} (type={}) is removed"
+                                   .format(info.name(), info.type()))
+                    else:
+                        remaining.append((section, info))
+                index[key] = remaining
+
+        # Process "new" field
+        #   - Add item if the same item doesn't exist in AnalysisResult.
+        if "new" in data:
+            new_section = SectionInfo()
+            for item in data["new"]:
+
+                # check if entry is already registered
+                has_entry = len(self._find_registered_info(index, item)) > 0
+
+                if not has_entry:
+                    if item["type"] == "constant":
+                        new_v = VariableInfo("constant")
+                        new_v.from_dict(item, 'NEW')
+                        new_section.info_list.append(new_v)
+                    elif item["type"] == "function":
+                        new_f = FunctionInfo("function")
+                        new_f.from_dict(item, 'NEW')
+                        new_section.info_list.append(new_f)
+                    elif item["type"] == "class":
+                        new_c = ClassInfo()
+                        new_c.from_dict(item, 'NEW')
+                        new_section.info_list.append(new_c)
+                    else:
+                        raise RuntimeError("Unsupported Type: {}"
+                                           .format(item["type"]))
+                else:
+                    output_log(LOG_LEVEL_WARN,
+                               "{} is already registered"
+                               .format(item["name"]))
+
+            result.section_info.append(new_section)
+            for info in new_section.info_list:
+                index[(info.type(), info.name())].append((new_section, info))
+
+        # Process "append" field
+        #   - Add item's field if the same exists in AnalysisResult.
+        #   - Value of item's field must be None.
+        if "append" in data:
+            for item in data["append"]:
+                for info in self._find_registered_info(index, item):
+                    info.from_dict(item, 'APPEND')
+
+        # Process "update" field
+        #   - Update item's field if the same exists in AnalysisResult.
+        #   - Value of item's field can be None or some values.
+        if "update" in data:
+            for item in data["update"]:
+                for info in self._find_registered_info(index, item):
+                    info.from_dict(item, 'UPDATE')
 
     def _modify_post_process(self, result: 'AnalysisResult'):
         pass
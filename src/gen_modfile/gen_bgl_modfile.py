@@ -27,6 +27,12 @@ import re
 from typing import List, Dict
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class GenerationConfig:
     bgl_c_file = None
@@ -201,9 +207,17 @@ def parse_options() -> 'GenerationConfig':
     return config
 
 
+def write_json(data: Dict, filename: str):
+    if ORJSON_AVAILABLE:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(filename, "w") as f:
+            json.dump(data, f, indent=4, sort_keys=True, separators=(",", ": "))
+
+
 def write_to_modfile(info: Dict, config: 'GenerationConfig'):
-    with open(config.output_file, "w") as f:
-        json.dump(info, f, indent=4, sort_keys=True, separators=(",", ": "))
+    write_json(info, config.output_file)
 
 
 def main():
@@ -13,7 +13,7 @@
 #
 # Usage:
 #   blender -noaudio --factory-startup --background --python \
-#     gen_module_modfile.py -- -m <first_import_module_name> -o <output_dir>
+#     gen_module_modfile.py -- -m <first_import_module_name> -o <output_dir> [-c]
 #
 #     first_import_module_name:
 #       Module name to import first.
@@ -25,15 +25,32 @@
 #       specified directory.
 #       (ex. gen_modules_modfile.generated)
 #
+#     -c:
+#       Skip generation if the modfiles in output_dir were generated from
+#       the same inputs by the previous run.
+#
 ################################################################################
 
 import sys
 import inspect
+import types
 import os
 import importlib
 import json
 import argparse
-from typing import List, Dict
+from collections import defaultdict
+import compileall
+import hashlib
+import struct
+import glob
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Set
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 EXCLUDE_MODULE_LIST = {
@@ -48,83 +65,304 @@ def separator():
     return "/"
 
 
+# Translation table to convert a relative file path into a module name.
+SEPARATOR_TO_DOT = str.maketrans({separator(): "."})
+
+
 class GenerationConfig:
     first_import_module_name = None
     output_dir = None
+    skip_unchanged = False
 
 
-def get_module_name_list(config: 'GenerationConfig') -> List[str]:
+def iter_python_files(dir_: str):
+    # Like os.walk(), symbolic links to directories are not followed.
+    # __pycache__ and hidden directories never contain modules to import.
+    for entry in os.scandir(dir_):
+        if entry.is_dir():
+            if not entry.is_symlink() and entry.name != "__pycache__" and \
+               not entry.name.startswith("."):
+                yield from iter_python_files(entry.path)
+        elif entry.name.endswith(".py"):
+            yield entry.path
+
+
+def get_modules_dir(config: 'GenerationConfig') -> str:
     first_module = importlib.import_module(config.first_import_module_name)
+    return os.path.dirname(first_module.__file__)
 
+
+def get_module_name_list(modules_dir: str, paths: List[str]) -> Set[str]:
     # Get modules to import.
-    modules_dir = os.path.dirname(first_module.__file__)
-    module_name_list = []
-    for cur_dir, _, files in os.walk(modules_dir):
-        for f in files:
-            if not f.endswith(".py"):
-                continue
-            module_name = os.path.join(cur_dir, f).replace(modules_dir + separator(), "")
-            module_name = module_name[:-3].replace(separator(), ".")
-            module_name = module_name.replace(".__init__", "")
-            module_name_list.append(module_name)
+    prefix_len = len(modules_dir) + 1
+    module_names = set()
+    for path in paths:
+        module_name = path[prefix_len:-3].translate(SEPARATOR_TO_DOT)
+        module_name = module_name.replace(".__init__", "")
+        if module_name not in EXCLUDE_MODULE_LIST:
+            module_names.add(module_name)
+
+    return module_names
+
+
+def compute_manifest(config: 'GenerationConfig', paths: List[str]) -> str:
+    # The generated modfiles depend on this script, the options, the blender
+    # build which provides C types (ex. bpy.types) and the module sources.
+    # The module sources are identified by their paths, modification times
+    # and sizes.
+    manifest = hashlib.sha256(sys.version.encode())
+    with open(__file__, "rb") as f:
+        manifest.update(f.read())
+    manifest.update(config.first_import_module_name.encode())
+    try:
+        import bpy
+        manifest.update(repr((bpy.app.version, bpy.app.build_hash)).encode())
+    except ImportError:
+        pass
+    for path in sorted(paths):
+        st = os.stat(path)
+        manifest.update(path.encode())
+        manifest.update(struct.pack("<qq", st.st_mtime_ns, st.st_size))
+
+    return manifest.hexdigest()
+
+
+def manifest_filename(config: 'GenerationConfig', manifest: str) -> str:
+    return os.path.join(config.output_dir, ".manifest-" + manifest)
+
+
+def is_up_to_date(config: 'GenerationConfig', manifest: str) -> bool:
+    try:
+        with open(manifest_filename(config, manifest), "r") as f:
+            filenames = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    return all(os.path.isfile(filename) for filename in filenames)
 
-    return list(set(module_name_list) - EXCLUDE_MODULE_LIST)
 
+def save_manifest(config: 'GenerationConfig', manifest: str, filenames: List[str]):
+    for old in glob.glob(os.path.join(config.output_dir, ".manifest-*")):
+        os.remove(old)
+    with open(manifest_filename(config, manifest), "w") as f:
+        json.dump(filenames, f)
 
-def import_modules(module_name_list: List[str]) -> List:
+
+def precompile_modules(modules_dir: str):
+    # Write .pyc files to __pycache__ for all modules including ones which
+    # are not imported by this script. (Imported modules get them anyway.)
+    # Nothing can be written to a read-only installation.
+    if not os.access(modules_dir, os.W_OK):
+        return
+    # Compile in-process. sys.executable is the blender binary when this
+    # script runs from blender, so worker processes can not be spawned.
+    # Errors are reported by importing the modules if they are really broken.
+    compileall.compile_dir(modules_dir, quiet=2, legacy=False)
+
+
+def import_modules(module_name_list: Set[str]) -> List[Tuple[str, object]]:
+    # Import modules concurrently to overlap file reading and compiling.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(importlib.import_module, name)
+                   for name in module_name_list]
+
+    # (module_name, module)
     imported_modules = []
-    for name in module_name_list:
-        mod = {}
-        mod["module"] = importlib.import_module(name)
-        mod["module_name"] = name
-        imported_modules.append(mod)
+    for name, future in zip(module_name_list, futures):
+        if future.exception() is None:
+            module = future.result()
+        else:
+            # Modules which import each other may fail to be imported from
+            # different threads. Retry it here, and raise an error as before
+            # if the module is really broken.
+            module = importlib.import_module(name)
+        imported_modules.append((name, module))
     
     return imported_modules
 
-def analyze_function(module_name: str, function, is_method=False) -> Dict:
-    function_def = {
-        "name": function[0],
-        "type": "method" if is_method else "function",
-        "return": {
+
+def filter_modules(modules_dir: str, imported_modules: List[Tuple[str, object]]) -> List[Tuple[str, object]]:
+    # Modules which are resolved to the file outside of 'modules' directory
+    # (ex. shadowed by another package in sys.path) are analyzed elsewhere.
+    prefix = modules_dir + separator()
+    return [(name, module) for name, module in imported_modules
+            if (getattr(module, "__file__", None) or "").startswith(prefix)]
+
+
+# Types of functions implemented in C which are not caught by
+# inspect.isbuiltin(). (method_descriptor, wrapper_descriptor,
+# method-wrapper, classmethod_descriptor)
+C_FUNCTION_TYPES = (
+    type(str.join),
+    type(object.__init__),
+    type(object().__str__),
+    type(dict.__dict__["fromkeys"]),
+)
+
+
+# id(function) -> (function, parameter names)
+# The function itself is held so that its id is not reused by other objects.
+_parameter_names_cache = {}
+
+
+def get_parameter_names(function) -> List[str]:
+    # inspect.signature() raises ValueError for C functions without
+    # __text_signature__, so skip it.
+    if isinstance(function, C_FUNCTION_TYPES) and \
+       not getattr(function, "__text_signature__", None):
+        return []
+
+    cached = _parameter_names_cache.get(id(function))
+    if cached is None:
+        try:
+            names = list(inspect.signature(function).parameters.keys())
+        except ValueError:
+            names = []
+        cached = (function, names)
+        _parameter_names_cache[id(function)] = cached
+
+    return list(cached[1])
+
+
+class FunctionDef:
+    __slots__ = ("name", "type", "module", "parameters")
+
+    def __init__(self, name: str, type_: str):
+        self.name = name
+        self.type = type_
+        self.module = None          # None for methods
+        self.parameters = None      # None for builtin functions
+
+    def to_dict(self) -> Dict:
+        # Keys are inserted in sorted order. (See write_json())
+        data = {}
+        if self.module is not None:
+            data["module"] = self.module
+        data["name"] = self.name
+        if self.parameters is not None:
+            data["parameters"] = self.parameters
+        data["return"] = {
             "type": "return",
         }
-    }
+        data["type"] = self.type
+
+        return data
+
+
+class AttributeDef:
+    __slots__ = ("name", "class_", "module")
+
+    def __init__(self, name: str, class_: str, module: str):
+        self.name = name
+        self.class_ = class_
+        self.module = module
+
+    def to_dict(self) -> Dict:
+        return {
+            "class": self.class_,
+            "module": self.module,
+            "name": self.name,
+            "type": "attribute",
+        }
+
+
+class ClassDef:
+    __slots__ = ("name", "module", "methods", "attributes")
+
+    def __init__(self, name: str, module: str):
+        self.name = name
+        self.module = module
+        self.methods = []       # List[FunctionDef]
+        self.attributes = []    # List[AttributeDef]
+
+    def to_dict(self) -> Dict:
+        return {
+            "attributes": [a.to_dict() for a in self.attributes],
+            "methods": [m.to_dict() for m in self.methods],
+            "module": self.module,
+            "name": self.name,
+            "type": "class",
+        }
+
+
+def analyze_function(module_name: str, function, is_method=False) -> 'FunctionDef':
+    function_def = FunctionDef(function[0], "method" if is_method else "function")
     if not is_method:
-        function_def["module"] = module_name
+        function_def.module = module_name
 
     if not inspect.isbuiltin(function[1]):
-        try:
-            function_def["parameters"] = list(inspect.signature(function[1]).parameters.keys())
-        except ValueError:
-            function_def["parameters"] = []
+        function_def.parameters = get_parameter_names(function[1])
     
     return function_def
 
 
-def analyze_class(module_name: str, class_) -> Dict:
-    class_def = {
-        "name": class_[0],
-        "type": "class",
-        "module": module_name,
-        "methods": [],
-        "attributes": [],
-    }
-    for x in [x for x in inspect.getmembers(class_[1])]:
-        if x[0].startswith("_"):
-            continue        # Skip private methods and attributes.
-
+# id(class) -> (class, members)
+# Classes are not keyed by themselves since a metaclass may make them
+# unhashable. The class itself is held so that its id is not reused.
+_class_members_cache = {}
+
+
+def get_class_members(class_) -> Tuple[Tuple[str, object], ...]:
+    # The result is cached per class, since a class bound to several names
+    # (ex. Alias = Klass) is analyzed for each of them.
+    cached = _class_members_cache.get(id(class_))
+    if cached is None:
+        cached = (class_, collect_class_members(class_))
+        _class_members_cache[id(class_)] = cached
+
+    return cached[1]
+
+
+def collect_class_members(class_) -> Tuple[Tuple[str, object], ...]:
+    # Collect public members as inspect.getmembers() does, but take plain
+    # functions straight from the class dictionaries along the MRO instead
+    # of calling getattr() for them.
+    mro = (class_,) + inspect.getmro(class_)
+    raw_members = {}
+    for klass in reversed(mro):
+        raw_members.update(vars(klass))
+
+    # Names come from dir() which may be customized by the metaclass.
+    # (ex. enum.EnumMeta hides aliases)
+    names = dir(class_)
+    for base in class_.__bases__:
+        for name, value in vars(base).items():
+            if isinstance(value, types.DynamicClassAttribute):
+                names.append(name)
+
+    members = []
+    processed = set()
+    for name in names:
+        if name.startswith("_"):
+            continue
+        value = raw_members.get(name)
+        if name in processed or not isinstance(value, types.FunctionType):
+            # Same as inspect.getmembers(), fall back to the class dictionary
+            # if getattr() fails or the name is listed twice.
+            try:
+                if name in processed:
+                    raise AttributeError
+                value = getattr(class_, name)
+            except AttributeError:
+                if name not in raw_members:
+                    continue
+        members.append((name, value))
+        processed.add(name)
+
+    members.sort(key=lambda member: member[0])
+    return tuple(members)
+
+
+def analyze_class(module_name: str, class_) -> 'ClassDef':
+    class_def = ClassDef(class_[0], module_name)
+    for x in get_class_members(class_[1]):     # private members are skipped
         # Get all class method definitions.
         if callable(x[1]):
-            class_def["methods"].append(analyze_function(module_name, x, True))
+            class_def.methods.append(analyze_function(module_name, x, True))
         # Get all class parameter definitions.
         else:
-            attribute_def = {
-                "type": "attribute",
-                "name": x[0],
-                "class": class_[0],
-                "module": module_name
-            }
-            class_def["attributes"].append(attribute_def)
+            class_def.attributes.append(AttributeDef(x[0], class_[0], module_name))
     
     return class_def
 
@@ -135,60 +373,69 @@ def analyze_module(module_name: str, module) -> Dict:
         "functions": [],
     }
 
-    # Get all class definitions.
-    classes = inspect.getmembers(module, inspect.isclass)
-    for c in classes:
-        if c[0].startswith("_"):
-            continue    # Skip private classes.
-        if inspect.isbuiltin(c[1]):
+    # Only names in __all__ are public if the module defines it.
+    exports = getattr(module, "__all__", None)
+    if exports is not None:
+        members = [(name, module.__dict__[name])
+                   for name in set(exports) if name in module.__dict__]
+    else:
+        members = module.__dict__.items()
+
+    # Get all class and function definitions in one pass.
+    # Names are visited in sorted order as inspect.getmembers() does.
+    for name, obj in sorted(members):
+        if name.startswith("_"):
+            continue    # Skip private classes and functions.
+        is_class = inspect.isclass(obj)
+        if not is_class and not inspect.isfunction(obj):
             continue
-        if inspect.getmodule(c[1]) != module:
-            continue    # Remove indirect classes. (ex. from XXX import ZZZ)
-        result["classes"].append(analyze_class(module_name, c))
-
-    # Get all function definitions.
-    functions = inspect.getmembers(module, inspect.isfunction)
-    for f in functions:
-        if f[0].startswith("_"):
-            continue    # Skip private functions.
-        if inspect.getmodule(f[1]) != module:
-            continue    # Remove indirect functions. (ex. from XXX import ZZZ)
-
-        result["functions"].append(analyze_function(module_name, f))
+        # Same as inspect.getmodule() for classes and functions.
+        if sys.modules.get(getattr(obj, "__module__", None)) is not module:
+            continue    # Remove indirect definitions. (ex. from XXX import ZZZ)
+
+        if is_class:
+            result["classes"].append(analyze_class(module_name, (name, obj)))
+        else:
+            result["functions"].append(analyze_function(module_name, (name, obj)))
     
     return result
 
 
-def analyze(modules: List) -> Dict:
-    results = {}
-    for m in modules:
-        results[m["module_name"]] = analyze_module(m["module_name"], m["module"])
+def analyze(modules: List[Tuple[str, object]]) -> Dict:
+    return {name: analyze_module(name, module) for name, module in modules}
+
 
-    return results
+def write_json(data: Dict, filename: str):
+    # Records are built with their keys already sorted, so sorting them again
+    # is only needed when dict does not keep insertion order. (Python < 3.6)
+    if ORJSON_AVAILABLE:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w") as f:
+            json.dump(data, f, indent=4, sort_keys=sys.version_info < (3, 6),
+                      separators=(",", ": "))
 
 
-def write_to_modfile(info: Dict, config: 'GenerationConfig'):
-    data = {}
+def write_to_modfile(info: Dict, config: 'GenerationConfig') -> List[str]:
+    data = defaultdict(lambda: {"new": []})
 
     for module_name, module_info in info.items():
-        package_name = module_name
-        index = package_name.find(".")
-        if index != -1:
-            package_name = package_name[:index]
-
-        if package_name not in data.keys():
-            data[package_name] = {
-                "new": []
-            }
-        for class_info in module_info["classes"]:
-            data[package_name]["new"].append(class_info)
-        for function_info in module_info["functions"]:
-            data[package_name]["new"].append(function_info)
+        package_name = module_name.partition(".")[0]
+        new_data = data[package_name]["new"]
+        new_data.extend(c.to_dict() for c in module_info["classes"])
+        new_data.extend(f.to_dict() for f in module_info["functions"])
 
+    # Each package is written to its own file, so write them concurrently.
     os.makedirs(config.output_dir, exist_ok=True)
-    for pkg, d in data.items():
-        with open("{}/{}.json".format(config.output_dir, pkg), "w") as f:
-            json.dump(d, f, indent=4, sort_keys=True, separators=(",", ": "))
+    filenames = ["{}/{}.json".format(config.output_dir, pkg) for pkg in data.keys()]
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(write_json, d, filename)
+                   for d, filename in zip(data.values(), filenames)]
+    for future in futures:
+        future.result()     # raise an error occurred while writing
+
+    return filenames
 
 
 def parse_options() -> 'GenerationConfig':
@@ -201,7 +448,7 @@ def parse_options() -> 'GenerationConfig':
     argv = argv[index:]
 
     usage = """Usage: blender -noaudio --factory-startup --background --python
-               {} -- [-m <first_import_module_name>] [-o <output_dir>]"""\
+               {} -- [-m <first_import_module_name>] [-o <output_dir>] [-c]"""\
         .format(__file__)
     parser = argparse.ArgumentParser(usage)
     parser.add_argument(
@@ -214,11 +461,18 @@ def parse_options() -> 'GenerationConfig':
     parser.add_argument(
         "-o", dest="output_dir", type=str, help="Output directory.", required=True
     )
+    parser.add_argument(
+        "-c", dest="skip_unchanged", action="store_true",
+        help="""Skip generation if the modfiles in output directory were
+        generated from the same inputs.
+        """
+    )
     args = parser.parse_args(argv)
 
     config = GenerationConfig()
     config.first_import_module_name = args.first_import_module_name
     config.output_dir = args.output_dir
+    config.skip_unchanged = args.skip_unchanged
 
     return config
 
@@ -226,17 +480,30 @@ def parse_options() -> 'GenerationConfig':
 def main():
     config = parse_options()
 
+    # Skip all if the inputs are not changed since the last run.
+    modules_dir = get_modules_dir(config)
+    paths = list(iter_python_files(modules_dir))
+    manifest = compute_manifest(config, paths)
+    if config.skip_unchanged and is_up_to_date(config, manifest):
+        print("Modfiles in {} are up to date.".format(config.output_dir))
+        return
+
+    # Compile modules to byte-code if they are not compiled yet.
+    precompile_modules(modules_dir)
+
     # Get modules to import.
-    module_name_list = get_module_name_list(config)
+    module_name_list = get_module_name_list(modules_dir, paths)
 
     # Import modules.
     imported_modules = import_modules(module_name_list)
+    imported_modules = filter_modules(modules_dir, imported_modules)
 
     # Analyze modules.
     results = analyze(imported_modules)
 
     # Write module info to file.
-    write_to_modfile(results, config)
+    filenames = write_to_modfile(results, config)
+    save_manifest(config, manifest, filenames)
 
 
 if __name__ == "__main__":
@@ -29,6 +29,12 @@ import json
 import os
 from typing import List, Dict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def separator():
     if os.name == "nt":
@@ -80,12 +86,14 @@ def is_primitive_class(class_: str) -> bool:
 
 def get_scripts_list_to_parse(config: 'GenerationConfig') -> List[str]:
     scripts_to_parse = []
+    sep = separator()
     for cur_dir, _, files in os.walk(config.startup_scripts_dir):
+        cur_dir = cur_dir.replace("/", sep)
         for file_ in files:
             if not file_.endswith(".py"):
                 continue
 
-            filepath = os.path.join(cur_dir, file_).replace("/", separator())
+            filepath = os.path.join(cur_dir, file_)
             with open(filepath, "r") as f:
                 lines = [l for l in f.readlines() if l.find("register_class(") != -1]
             if len(lines) > 0:
@@ -185,9 +193,17 @@ def analyze(scripts_paths: List[str]) -> Dict:
     return data
 
 
+def write_json(data: Dict, filename: str):
+    if ORJSON_AVAILABLE:
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(filename, "w") as f:
+            json.dump(data, f, indent=4, sort_keys=True, separators=(",", ": "))
+
+
 def write_to_modfile(info: Dict, config: 'GenerationConfig'):
-    with open(config.output_file, "w") as f:
-        json.dump(info, f, indent=4, sort_keys=True, separators=(",", ": "))
+    write_json(info, config.output_file)
 
 
 def main():